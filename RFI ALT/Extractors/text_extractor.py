@@ -18,7 +18,11 @@ def _read_with_pymupdf(pdf: Path) -> Tuple[str, Dict[str, Any]]:
             for page in doc:
                 # "text" is the simplest/plain extraction; "blocks" sometimes helps but can add noise
                 text_parts.append(page.get_text("text") or "")
-        text = "\n".join(text_parts)
+            text = "\n".join(text_parts)
+            # Only a doc without a text layer is checked for being a scan, so
+            # only then pay for listing each page's images
+            if not text.strip():
+                meta["image_pages"] = sum(1 for page in doc if page.get_images())
         meta["ok"] = True
         meta["elapsed_ms"] = round((time.perf_counter() - t0) * 1000, 1)
         return text, meta
@@ -137,9 +141,10 @@ def extract_text_with_meta(
       2) pdfminer.six
       3) pdfplumber
       4) OCR (optional; tolerant to missing Poppler/Tesseract)
+    Image-only scans with no text layer skip 2) and 3) and go straight to OCR.
     meta keys:
       - method: which path produced the final text ('pymupdf'/'pdfminer'/'pdfplumber'/'ocr'/'none')
-      - text_len, ocr_used, ocr_pages, elapsed_ms
+      - text_len, ocr_used, ocr_pages, page_count (0 if unknown), elapsed_ms
       - and sub-keys from each engine like engine errors for debugging
     """
     p = Path(pdf_path)
@@ -147,18 +152,29 @@ def extract_text_with_meta(
 
     # 1) PyMuPDF
     text, m1 = _read_with_pymupdf(p)
+    page_count = m1.get("pages") or 0
     if len(text.strip()) >= 30:
         return text, {
             "method": "pymupdf",
             "text_len": len(text),
             "ocr_used": False,
             "ocr_pages": 0,
+            "page_count": page_count,
             "elapsed_ms": round((time.perf_counter() - t0_all) * 1000, 1),
             **m1,
         }
 
+    # Scanned document: PyMuPDF read it fine but found no text layer at all and
+    # every page is an image. pdfminer/pdfplumber would read the same empty
+    # text layer, so skip them and go straight to OCR.
+    scanned = bool(m1.get("ok") and not text.strip() and page_count
+                   and m1.get("image_pages") == page_count)
+
     # 2) pdfminer
-    text2, m2 = _read_with_pdfminer(p)
+    if scanned:
+        text2, m2 = "", {"engine": "pdfminer", "ok": False, "skipped": "scanned"}
+    else:
+        text2, m2 = _read_with_pdfminer(p)
     if len(text2.strip()) > len(text.strip()):
         text = text2
         best = "pdfminer"
@@ -172,12 +188,17 @@ def extract_text_with_meta(
             "text_len": len(text),
             "ocr_used": False,
             "ocr_pages": 0,
+            "page_count": page_count,
             "elapsed_ms": round((time.perf_counter() - t0_all) * 1000, 1),
             "pymupdf": m1, "pdfminer": m2,
         }
 
     # 3) pdfplumber
-    text3, m3 = _read_with_pdfplumber(p)
+    if scanned:
+        text3, m3 = "", {"engine": "pdfplumber", "ok": False, "skipped": "scanned"}
+    else:
+        text3, m3 = _read_with_pdfplumber(p)
+    page_count = page_count or m3.get("pages") or 0
     if len(text3.strip()) > len(text.strip()):
         text = text3
         best = "pdfplumber"
@@ -188,6 +209,7 @@ def extract_text_with_meta(
             "text_len": len(text),
             "ocr_used": False,
             "ocr_pages": 0,
+            "page_count": page_count,
             "elapsed_ms": round((time.perf_counter() - t0_all) * 1000, 1),
             "pymupdf": m1, "pdfminer": m2, "pdfplumber": m3,
         }
@@ -203,6 +225,7 @@ def extract_text_with_meta(
                 "text_len": len(text),
                 "ocr_used": True,
                 "ocr_pages": m4.get("pages", 0),
+                "page_count": page_count,
                 "elapsed_ms": round((time.perf_counter() - t0_all) * 1000, 1),
                 "pymupdf": m1, "pdfminer": m2, "pdfplumber": m3, "ocr": m4,
             }
@@ -212,6 +235,7 @@ def extract_text_with_meta(
             "text_len": len(text),
             "ocr_used": bool(m4.get("ok", False)),
             "ocr_pages": m4.get("pages", 0),
+            "page_count": page_count,
             "elapsed_ms": round((time.perf_counter() - t0_all) * 1000, 1),
             "pymupdf": m1, "pdfminer": m2, "pdfplumber": m3, "ocr": m4,
         }
@@ -222,6 +246,7 @@ def extract_text_with_meta(
         "text_len": len(text),
         "ocr_used": False,
         "ocr_pages": 0,
+        "page_count": page_count,
         "elapsed_ms": round((time.perf_counter() - t0_all) * 1000, 1),
         "pymupdf": m1, "pdfminer": m2, "pdfplumber": m3,
     }
\ No newline at end of file
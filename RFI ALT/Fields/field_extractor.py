@@ -1,7 +1,7 @@
 # fields/field_extractors.py
 # Minimal extractors kept in use by workers.py:
 #   - rfi_number_from_folder()
-#   - detail_refs()
+#   - detail_refs() / detail_ref_list()
 from __future__ import annotations
 import re
 from typing import Iterable, List
@@ -93,35 +93,45 @@ def detail_refs(text: str) -> str:
     Extract detail/sheet references and SK refs from free text.
     Return a CSV string: '8/S303, 12/A501, SK-235'
     """
+    return ", ".join(detail_ref_list(text))
+
+def detail_ref_list(text: str) -> List[str]:
+    """
+    Same references as detail_refs(), as a deduped list in first-seen order
+    (for callers that post-process the items rather than print them).
+    """
     t = text or ""
     found: List[str] = []
+    # Each pattern needs a literal ("/", "det", "sk"); skip the passes that cannot match
+    tl = t.lower()
 
     # 1) 8/S303 style
-    for m in RX_DETAIL_SLASH.finditer(t):
-        det = m.group("det")
-        sheet = _norm_sheet(m.group("sheet"))
-        found.append(f"{det}/{sheet}")
+    if "/" in t:
+        for m in RX_DETAIL_SLASH.finditer(t):
+            det = m.group("det")
+            sheet = _norm_sheet(m.group("sheet"))
+            found.append(f"{det}/{sheet}")
 
     # 2) 'Detail 5 on S401' style
-    for m in RX_DETAIL_ON_SHEET.finditer(t):
-        det = m.group("det")
-        sheet = _norm_sheet(m.group("sheet"))
-        found.append(f"{det}/{sheet}")
+    if "det" in tl:
+        for m in RX_DETAIL_ON_SHEET.finditer(t):
+            det = m.group("det")
+            sheet = _norm_sheet(m.group("sheet"))
+            found.append(f"{det}/{sheet}")
 
     # 3) SK refs
-    for m in RX_SK.finditer(t):
-        num = (m.group("num") or "").upper()
-        num = num.replace(" ", "")
-        # Standardize as SK-###
-        if not num.startswith("SK-"):
-            val = f"SK-{num}"
-        else:
-            val = num
-        # Ensure single hyphen after SK
-        val = "SK-" + val.split("SK-")[-1]
-        found.append(val)
-
-    # Dedupe and return CSV
-    found = _dedup_preserve(found)
-    return ", ".join(found)
+    if "sk" in tl or "ſ" in tl:  # IGNORECASE lets "ſ" stand in for "s"
+        for m in RX_SK.finditer(t):
+            num = (m.group("num") or "").upper()
+            num = num.replace(" ", "")
+            # Standardize as SK-###
+            if not num.startswith("SK-"):
+                val = f"SK-{num}"
+            else:
+                val = num
+            # Ensure single hyphen after SK
+            val = "SK-" + val.split("SK-")[-1]
+            found.append(val)
+
+    return _dedup_preserve(found)
 
@@ -1,6 +1,7 @@
 # main.py — interactive append/overwrite/delete BEFORE scanning (lean Excel, blanks -> "null")
 from __future__ import annotations
 import argparse
+import importlib.util
 import os
 import logging
 import warnings
@@ -34,6 +35,11 @@ FINAL_COLS = [
     "AreaCategory","DetailRefs",
 ]
 
+# xlsxwriter writes .xlsx noticeably faster and leaner than pandas' default
+# openpyxl writer; use it when installed. (Its constant_memory mode can't be
+# used: pandas emits cells column by column, which that mode would drop.)
+EXCEL_ENGINE = "xlsxwriter" if importlib.util.find_spec("xlsxwriter") else None
+
 # ---------------- utilities ----------------
 
 def _env_truthy(key: str, default_true: bool = True) -> bool:
@@ -47,7 +53,7 @@ def _atomic_write(df: pd.DataFrame, out_path: Path, attempts: int = 6, base_dela
         tmp = out_path.with_suffix(f".tmp.{os.getpid()}.{i}{out_path.suffix}")
         try:
             if kind == "excel":
-                df.to_excel(tmp, index=False)
+                df.to_excel(tmp, index=False, engine=EXCEL_ENGINE)
             else:
                 df.to_csv(tmp, index=False, encoding="utf-8")
             os.replace(tmp, out_path)
@@ -63,7 +69,7 @@ def _atomic_write(df: pd.DataFrame, out_path: Path, attempts: int = 6, base_dela
             raise
     ts = time.strftime("%Y%m%d_%H%M%S")
     fb = out_path.with_name(f"{out_path.stem}_{ts}{out_path.suffix}")
-    if kind == "excel": df.to_excel(fb, index=False)
+    if kind == "excel": df.to_excel(fb, index=False, engine=EXCEL_ENGINE)
     else: df.to_csv(fb, index=False, encoding="utf-8")
     print(f"⚠️ '{out_path.name}' locked. Wrote fallback: {fb}")
     if last_err: print(f"(Last error: {last_err})")
@@ -51,8 +51,10 @@ if RULES is None:
     CONFIRM_CONN_RX  = re.compile(r"\bconfirm(?:ing|ation of)?\s+connections?\b", re.I)
     SHOP_DRAW_RX     = re.compile(r"\bshop\s+drawings?\b", re.I)
 
+    WS_RX = re.compile(r"\s+")
+
     def _find(rx, t):
-        return list({re.sub(r"\s+"," ",m.group(0).lower()).strip() for m in rx.finditer(t or "")})
+        return list({WS_RX.sub(" ",m.group(0).lower()).strip() for m in rx.finditer(t or "")})
 
     def _counts(t: str) -> Dict[str,int]:
         c = {"strong": len(_find(RX_S,t)), "medium": len(_find(RX_M,t)), "disc": len(_find(RX_D,t)),
@@ -4,25 +4,74 @@ import re
 from typing import List, Dict, Tuple
 
 # ---------- helpers ----------
-def _phrases_to_regex(phrases: List[str]) -> re.Pattern:
+def _phrases_to_regex(phrases: List[str], ignore_case: bool = True) -> re.Pattern:
+    """ignore_case=False gives the lower-cased twin, meant to run over text.lower()."""
     parts = []
     for p in phrases:
         p = p.strip()
         if not p:
             continue
+        if not ignore_case:
+            p = p.lower()
         parts.append(rf"\b{re.escape(p).replace(r'\ ', r'\s+')}\b")
-    return re.compile("|".join(parts), re.IGNORECASE) if parts else re.compile(r"(?!x)x", re.IGNORECASE)
+    if not parts:
+        return re.compile(r"(?!x)x", re.IGNORECASE)
+    return re.compile("|".join(parts), re.IGNORECASE if ignore_case else 0)
 
-def _find_terms(rx: re.Pattern, text: str) -> List[str]:
-    if not text:
+def _count_sk(text: str, text_lower: str) -> int:
+    # Most documents carry no SK refs: a literal pre-check skips the regex scan,
+    # and len(findall) counts in C instead of stepping match objects in Python.
+    # (IGNORECASE also matches "ſ" as "s"; the Kelvin sign already lowers to "k".)
+    if "sk" not in text_lower and "ſ" not in text_lower:
+        return 0
+    return len(SK_RE.findall(text))
+
+def _count_positive(text: str) -> int:
+    seen = set()
+    for m in POS_FUSED.finditer(text):
+        seen.add(m.lastgroup)
+        if len(seen) == len(POSITIVE_PATTERNS):
+            break
+    return len(seen)
+
+def _anchor_words(phrases: List[str]) -> Tuple[str, ...]:
+    """
+    The longest word of each phrase: every hit of the phrase contains it verbatim.
+    Anchors containing a shorter anchor are dropped ("conflicting" ⊃ "conflict").
+    """
+    words = {max(p.lower().split(), key=len) for p in phrases if p.strip()}
+    return tuple(sorted(w for w in words if not any(o != w and o in w for o in words)))
+
+# IGNORECASE also lets İ/ı match "i" and ſ match "s" (K already lowers to "k");
+# fold them so a literal probe on the lowered text never misses a regex hit.
+_FOLD_TABLE = str.maketrans({"\u0307": None, "\u0131": "i", "\u017f": "s"})
+
+def _fold(text: str) -> str:
+    t = text.lower()
+    return t if t.isascii() else t.translate(_FOLD_TABLE)
+
+def _lower_view(text: str, text_lower: str) -> str | None:
+    """
+    text.lower() when a case-sensitive scan of it finds exactly what an
+    IGNORECASE scan of `text` finds, else None. lower() keeps every other
+    char's length and word/space class; only İ grows, and only ı/ſ are
+    IGNORECASE-equal to "i"/"s" without lowering to them.
+    """
+    if len(text_lower) != len(text):
+        return None
+    if not text_lower.isascii() and ("ı" in text_lower or "ſ" in text_lower):
+        return None
+    return text_lower
+
+_WS_RX = re.compile(r"\s+")
+
+def _find_terms(rx: re.Pattern, text: str, min_len: int = 0) -> List[str]:
+    if not text or len(text) < min_len:
         return []
-    hits = []
-    for m in rx.finditer(text):
-        s = m.group(0).lower().replace("’", "'")
-        s = re.sub(r"\s+", " ", s).strip()
-        if s not in hits:
-            hits.append(s)
-    return hits
+    # findall collects the (group-less) hits in C; each distinct raw hit is
+    # normalised once, and dict keys dedupe in first-seen order
+    raw = dict.fromkeys(rx.findall(text))
+    return list(dict.fromkeys(_WS_RX.sub(" ", s.lower().replace("’", "'")).strip() for s in raw))
 
 # ---------- vocabulary from the Review Sheet ----------
 _STRONG = [
@@ -84,47 +133,118 @@ POSITIVE_PATTERNS = [
     r"\brevis(?:e|ed|ion)\s+(?:drawing|sheet|plan|detail)s?\b",
     r"\bissue\s+(?:an?\s*)?sk[- ]?\d+\b",
 ]
-POS_RE = [re.compile(p, re.IGNORECASE) for p in POSITIVE_PATTERNS]
+# One alternation with a named group per pattern: a single scan tells us
+# which of the patterns occur at all (m.lastgroup names the one that hit).
+POS_FUSED = re.compile(
+    "|".join(f"(?P<p{i}>{p})" for i, p in enumerate(POSITIVE_PATTERNS)), re.IGNORECASE
+)
 
 # --- Boss rule: “confirm connection(s)” in shop drawings ⇒ treat as a negator when no stronger signals ---
 CONFIRM_CONN_RX   = re.compile(r"\bconfirm(?:ing|ation of)?\s+connections?\b", re.IGNORECASE)
 SHOP_DRAWINGS_RX  = re.compile(r"\bshop\s+drawings?\b", re.IGNORECASE)
 
+def _soft_negator(text: str, text_lower: str | None = None) -> bool:
+    # Both cues need a literal word; plain `in` probes on the lowered text rule
+    # out most documents before either regex runs (unless lowering isn't exact)
+    tl = _lower_view(text, text.lower() if text_lower is None else text_lower)
+    if tl is not None and ("confirm" not in tl or "shop" not in tl):
+        return False
+    return bool(CONFIRM_CONN_RX.search(text) and SHOP_DRAWINGS_RX.search(text))
+
 # Compiled regexes
 RX_S = _phrases_to_regex(_STRONG)
 RX_M = _phrases_to_regex(_MEDIUM)
 RX_D = _phrases_to_regex(_DISC)
 RX_W = _phrases_to_regex(_WEAK)
 RX_N = _phrases_to_regex(_NEG)
+# Case-sensitive lower-case twins: same hits over text.lower(), without the
+# per-char case folding IGNORECASE does inside the regex engine
+RX_S_LC = _phrases_to_regex(_STRONG, ignore_case=False)
+RX_M_LC = _phrases_to_regex(_MEDIUM, ignore_case=False)
+RX_D_LC = _phrases_to_regex(_DISC, ignore_case=False)
+RX_W_LC = _phrases_to_regex(_WEAK, ignore_case=False)
+RX_N_LC = _phrases_to_regex(_NEG, ignore_case=False)
+
+# Shortest phrase per bucket: a text shorter than that cannot match it
+# (\s+ between words only ever lengthens a hit), so the scan can be skipped.
+BUCKET_MIN_LEN = {
+    "strong": min(len(p) for p in _STRONG),
+    "medium": min(len(p) for p in _MEDIUM),
+    "disc":   min(len(p) for p in _DISC),
+    "weak":   min(len(p) for p in _WEAK),
+    "neg":    min(len(p) for p in _NEG),
+}
+# A bucket can only match if one of its anchor words occurs literally, so a few
+# substring probes on the folded text skip most bucket scans on quiet documents.
+BUCKET_ANCHORS = {
+    "strong": _anchor_words(_STRONG),
+    "medium": _anchor_words(_MEDIUM),
+    "disc":   _anchor_words(_DISC),
+    "weak":   _anchor_words(_WEAK),
+    "neg":    _anchor_words(_NEG),
+}
+BUCKETS = (
+    ("strong", RX_S, RX_S_LC),
+    ("medium", RX_M, RX_M_LC),
+    ("disc",   RX_D, RX_D_LC),
+    ("weak",   RX_W, RX_W_LC),
+    ("neg",    RX_N, RX_N_LC),
+)
+
+def _bucket_terms(text: str, text_lower: str | None = None) -> Dict[str, List[str]]:
+    """Unique matched terms per bucket, one scan per bucket regex."""
+    t = text or ""
+    tl = _lower_view(t, t.lower() if text_lower is None else text_lower)
+    probe = tl if tl is not None else _fold(t)
+    terms: Dict[str, List[str]] = {}
+    for name, rx, rx_lc in BUCKETS:
+        if not any(a in probe for a in BUCKET_ANCHORS[name]):
+            terms[name] = []
+        elif tl is not None:
+            terms[name] = _find_terms(rx_lc, tl, BUCKET_MIN_LEN[name])
+        else:
+            terms[name] = _find_terms(rx, t, BUCKET_MIN_LEN[name])
+    return terms
 
 # ---------- public API ----------
-def category_counts(text: str) -> Dict[str, int]:
+# `terms` (from _bucket_terms) lets decide() share one scan between the two calls below
+def category_counts(
+    text: str, terms: Dict[str, List[str]] | None = None, text_lower: str | None = None
+) -> Dict[str, int]:
     t = text or ""
+    tl = t.lower() if text_lower is None else text_lower
+    if terms is None:
+        terms = _bucket_terms(t, tl)
     counts = {
-        "strong": len(_find_terms(RX_S, t)),
-        "medium": len(_find_terms(RX_M, t)),
-        "disc":   len(_find_terms(RX_D, t)),
-        "weak":   len(_find_terms(RX_W, t)),
-        "neg":    len(_find_terms(RX_N, t)),
-        "sk":     len(SK_RE.findall(t)),
-        "posx":   sum(1 for rx in POS_RE if rx.search(t)),
+        "strong": len(terms["strong"]),
+        "medium": len(terms["medium"]),
+        "disc":   len(terms["disc"]),
+        "weak":   len(terms["weak"]),
+        "neg":    len(terms["neg"]),
+        "sk":     _count_sk(t, tl),
+        "posx":   _count_positive(t),
     }
     # Soft-negator: only counts as neg when BOTH terms appear.
-    if CONFIRM_CONN_RX.search(t) and SHOP_DRAWINGS_RX.search(t):
+    if _soft_negator(t, tl):
         counts["neg"] += 1  # ensures total>0 so we don't label as InsufficientSignal
         counts["soft_neg"] = 1
     else:
         counts["soft_neg"] = 0
     return counts
 
-def extract_keywords(text: str) -> List[str]:
+def extract_keywords(
+    text: str, terms: Dict[str, List[str]] | None = None, text_lower: str | None = None
+) -> List[str]:
     if not text:
         return []
+    tl = text.lower() if text_lower is None else text_lower
+    if terms is None:
+        terms = _bucket_terms(text, tl)
     out = []
-    for rx in (RX_S, RX_M, RX_D, RX_W):
-        out.extend(_find_terms(rx, text))
+    for bucket in ("strong", "medium", "disc", "weak"):
+        out.extend(terms[bucket])
     # add a readable token for the soft-negator (optional)
-    if CONFIRM_CONN_RX.search(text or "") and SHOP_DRAWINGS_RX.search(text or ""):
+    if _soft_negator(text, tl):
         out.append("confirm connection (shop drawings)")
     # unique, stable order
     seen, uniq = set(), []
@@ -146,31 +266,36 @@ def decide(text: str) -> Tuple[bool, str, Dict[str,int], List[str]]:
     Deterministic, no numeric confidence.
     """
     t = text or ""
-    c = category_counts(t)
-    kws = extract_keywords(t)
+    tl = t.lower()  # shared by every case-insensitive probe below
+    terms = _bucket_terms(t, tl)
+    c = category_counts(t, terms, tl)
+    kws = extract_keywords(t, terms, tl)
+    # read each count once; the rules below test them repeatedly
+    strong, medium, disc, weak = c["strong"], c["medium"], c["disc"], c["weak"]
+    neg, sk, posx = c["neg"], c["sk"], c["posx"]
 
-    total = c["strong"] + c["medium"] + c["disc"] + c["weak"] + c["neg"] + c["sk"] + c["posx"]
+    total = strong + medium + disc + weak + neg + sk + posx
     if total == 0:
         return (False, "InsufficientSignal", c, kws)
 
     # Negators (including soft-neg) with no Strong/Medium → No
-    if c["neg"] > 0 and (c["strong"] == 0 and c["medium"] == 0):
+    if neg > 0 and (strong == 0 and medium == 0):
         return (False, "NegatedOnly", c, kws)
 
     # Any strong term → Yes
-    if c["strong"] > 0:
+    if strong > 0:
         return (True, "StrongSignal", c, kws)
 
     # Medium combos → Yes
-    if c["medium"] >= 2 or (c["medium"] >= 1 and c["disc"] >= 1):
+    if medium >= 2 or (medium >= 1 and disc >= 1):
         return (True, "MediumCombo", c, kws)
 
     # Discipline + sketch/positive pattern → Yes
-    if c["disc"] >= 2 and (c["sk"] > 0 or c["posx"] > 0):
+    if disc >= 2 and (sk > 0 or posx > 0):
         return (True, "Discipline+Sketch", c, kws)
 
     # Weak-only signals present → No
-    if c["weak"] > 0:
+    if weak > 0:
         return (False, "WeakSignal", c, kws)
 
     # Fallback
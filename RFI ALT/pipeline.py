@@ -8,11 +8,26 @@ from tqdm import tqdm
 from concurrent.futures import ProcessPoolExecutor, as_completed
 
 from Fields.field_extractor import rfi_number_from_folder
-from workers import process_pdf
+from workers import process_pdf, warm_up
 
 Row = Dict[str, Any]
 Audit = Dict[str, Any]
 
+# Static schemas of process_pdf()'s "row" and "meta" dicts; each column is
+# built straight into its dtype, so no per-column inference or astype pass.
+ROW_DTYPES = {
+    "RfiNumber": "string", "PdfTitle": "string", "Description": "string",
+    "RequiresDrawingRevision": "string", "DecisionBasis": "string",
+    "AreaCategory": "string", "DetailRefs": "string", "TopSignals": "string",
+    "LocalPath": "string", "Status": "string", "Error": "string",
+}
+AUDIT_DTYPES = {
+    "pdf": "string", "rfi_no": "string", "method": "string",
+    "text_len": "int64", "ocr_used": "bool", "ocr_pages": "int64",
+    "attempts": "int64", "forced_second_attempt": "bool", "elapsed_ms": "float64",
+    "status": "string", "error": "string",
+}
+
 EXCLUDE_DIRS = {
     "__pycache__", "_results", "extractors", "fields", "nlp",
     ".git", ".github", ".venv", "venv", "env",
@@ -28,12 +43,15 @@ def _discover_tasks(local_root: Path) -> List[Tuple[str, str]]:
     if not local_root.exists():
         raise FileNotFoundError(f"LOCAL_ROOT not found: {local_root}")
 
-    subdirs = sorted(
-        p for p in local_root.iterdir()
-        if p.is_dir()
-        and p.name not in EXCLUDE_DIRS
-        and not p.name.startswith((".", "_"))
-    )
+    # scandir's DirEntry.is_dir() reuses the type from the directory listing,
+    # saving a stat() per entry (noticeable on network shares)
+    with os.scandir(local_root) as it:
+        subdirs = sorted(
+            Path(e.path) for e in it
+            if e.name not in EXCLUDE_DIRS
+            and not e.name.startswith((".", "_"))
+            and e.is_dir()
+        )
 
     if subdirs:
         # Per-RFI subfolders
@@ -52,6 +70,9 @@ def _discover_tasks(local_root: Path) -> List[Tuple[str, str]]:
 
     return tasks
 
+def _to_frame(records: List[Dict[str, Any]], dtypes: Dict[str, str]) -> pd.DataFrame:
+    return pd.DataFrame({col: pd.Series([r[col] for r in records], dtype=dt) for col, dt in dtypes.items()})
+
 def run_local(
     local_root: Path,
     limit: int | None = None,
@@ -82,16 +103,22 @@ def run_local(
             result = process_pdf(pdf_path, rfi_no, ocr_if_needed, ocr_max_pages)
             rows.append(result["row"])
             audit.append(result["meta"])
-        return pd.DataFrame(rows), pd.DataFrame(audit)
+        return _to_frame(rows, ROW_DTYPES), _to_frame(audit, AUDIT_DTYPES)
 
-    with ProcessPoolExecutor(max_workers=workers) as ex:
-        futures = [
-            ex.submit(process_pdf, pdf_path, rfi_no, ocr_if_needed, ocr_max_pages)
-            for (pdf_path, rfi_no) in all_tasks
-        ]
+    # One future per PDF, so idle workers pick up the next task and a slow OCR
+    # PDF never holds back the fast ones. Results are slotted by task index to
+    # keep the output rows in discovery order.
+    results: List[Dict[str, Any] | None] = [None] * len(all_tasks)
+    with ProcessPoolExecutor(max_workers=workers, initializer=warm_up) as ex:
+        futures = {
+            ex.submit(process_pdf, pdf_path, rfi_no, ocr_if_needed, ocr_max_pages): i
+            for i, (pdf_path, rfi_no) in enumerate(all_tasks)
+        }
         for fut in tqdm(as_completed(futures), total=len(futures), desc=f"Processing with {workers} workers"):
-            result = fut.result()
-            rows.append(result["row"])
-            audit.append(result["meta"])
+            results[futures[fut]] = fut.result()
+
+    for result in results:
+        rows.append(result["row"])
+        audit.append(result["meta"])
 
-    return pd.DataFrame(rows), pd.DataFrame(audit)
+    return _to_frame(rows, ROW_DTYPES), _to_frame(audit, AUDIT_DTYPES)
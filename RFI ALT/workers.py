@@ -2,19 +2,28 @@
 # and out-of-scope override (areas not G–K and no Phase 2 -> No revision).
 from __future__ import annotations
 from pathlib import Path
-from typing import Dict, Any, List, Tuple
-import time, re, unicodedata
+from typing import Dict, Any, Callable, List, NamedTuple, Tuple
+import time, re, unicodedata, hashlib, json, os
+from collections import OrderedDict
+from functools import lru_cache
 
 from Extractors.text_extractor import extract_text_with_meta
-from Fields.field_extractor import rfi_number_from_folder, detail_refs
+from Fields.field_extractor import rfi_number_from_folder, detail_ref_list
 from nlp.classifier import classify
 
-MIN_OK_LEN = 50
+# Every PDF in an RFI folder asks about the same parent name; memoize the parse.
+_rfi_no_from_folder = lru_cache(maxsize=4096)(rfi_number_from_folder)
 
-def _limit_csv_list(csv: str, max_items: int) -> str:
-    if not csv:
+MIN_OK_LEN = 50
+RETRY_OCR_PAGES = 20
+# Keyword classification and detail-ref scans read at most this many chars:
+# revision signals sit on the cover sheet/response block, and the cap bounds
+# the worst case on huge merged PDFs. Area and description scans are uncapped.
+MAX_SCAN_CHARS = 200_000
+
+def _limit_list(items: List[str], max_items: int) -> str:
+    if not items:
         return ""
-    items = [x.strip() for x in csv.split(",") if x.strip()]
     if len(items) <= max_items:
         return ", ".join(items)
     rest = len(items) - max_items
@@ -22,10 +31,18 @@ def _limit_csv_list(csv: str, max_items: int) -> str:
 
 
 # ---------- Area / Phase detection ----------
-RANGE_GK_RX      = re.compile(r"\bareas?\s+g\s*(?:-|–|—|to|through|thru)\s*k\b", re.IGNORECASE)
-AREA_LETTER_RX   = re.compile(r"\barea\s*[-–—:]?\s*([A-Z])\b", re.IGNORECASE)
-LOCATION_AREA_RX = re.compile(r"\blocation\s*[:\-–—]?\s*area\s*([A-Z])\b", re.IGNORECASE)
-PHASE2_RX        = re.compile(r"\bphase\s*[-–—:]?\s*(2|ii|two)\b", re.IGNORECASE)
+RANGE_GK_RX = re.compile(r"\bareas?\s+g\s*(?:[-–—]|t(?:o|hrough|hru))\s*k\b", re.IGNORECASE)
+
+# Single-pass scanner over the per-letter/phase cues: "Location: Area <X>",
+# "Area <X>" and "Phase 2". The alternatives start on different words and never
+# overlap; a "Location: Area X" hit also stands in for the plain "Area X" hit
+# inside it.
+AREA_PHASE_SCAN_RX = re.compile(
+    r"(?P<loc>\blocation\s*[:\-–—]?\s*area\s*(?P<loc_letter>[A-Z])\b)"
+    r"|(?P<area>\barea\s*[-–—:]?\s*(?P<area_letter>[A-Z])\b)"
+    r"|(?P<phase>\bphase\s*[-–—:]?\s*(?:2|ii|two)\b)",
+    re.IGNORECASE,
+)
 
 G_TO_K = {"G", "H", "I", "J", "K"}
 
@@ -47,15 +64,27 @@ def _detect_area_phase_raw(text: str) -> Tuple[str, bool]:
     there is no Phase 2 (e.g., "Location: Area C") -> force No revision.
     """
     t = text or ""
-    phase = bool(PHASE2_RX.search(t))
 
     # explicit range G–K
     if RANGE_GK_RX.search(t):
         return ("Areas G–K", False)
 
+    # one pass collects Phase 2 plus "Location: Area <X>" / "Area <X>" letters
+    phase = False
+    loc_letters: List[str] = []
+    any_letters: List[str] = []
+    for m in AREA_PHASE_SCAN_RX.finditer(t):
+        kind = m.lastgroup
+        if kind == "phase":
+            phase = True
+        elif kind == "loc":
+            letter = m.group("loc_letter")
+            loc_letters.append(letter)
+            any_letters.append(letter)
+        else:
+            any_letters.append(m.group("area_letter"))
+
     # prefer "Location: Area <X>"
-    loc_letters = LOCATION_AREA_RX.findall(t)
-    any_letters = AREA_LETTER_RX.findall(t)
     letter_loc = _first_gk(loc_letters)
     letter_any = _first_gk(any_letters)
     gk_letter = letter_loc or letter_any
@@ -79,32 +108,32 @@ def _detect_area_phase_raw(text: str) -> Tuple[str, bool]:
 
 
 # ---------- Description extraction (robust) ----------
-def _normalize_text(s: str) -> str:
+class NormalizedText(NamedTuple):
+    text: str
+    lower: str  # text.lower(), computed once for case-insensitive literal probes
+
+DASH_TABLE = str.maketrans({"–": "-", "—": "-"})
+HSPACE_RX = re.compile(r"[ \t]+")
+
+def _normalize_text(s: str) -> NormalizedText:
     if not s:
-        return ""
-    s = unicodedata.normalize("NFKC", s)
-    s = s.replace("–", "-").replace("—", "-")
-    s = re.sub(r"[ \t]+", " ", s)
-    return s
+        return NormalizedText("", "")
+    # Each step below returns a fresh copy of the head, so skip the ones that
+    # would leave it unchanged (NFKC is the identity on pure ASCII)
+    if not s.isascii():
+        s = unicodedata.normalize("NFKC", s).translate(DASH_TABLE)
+    if "\t" in s or "  " in s:
+        s = HSPACE_RX.sub(" ", s)
+    return NormalizedText(s, s.lower())
 
 # NOTE: We escape literal '#' as '\#' because we're using VERBOSE mode (?x).
-_PATTERNS = [
-    re.compile(r"""(?ix)
-        \bRFI\s*(?:No\.?|\#\:|\#)?\s*(?P<num>\d{1,6})
-        \s*(?:[:\-]\s*)?
-        (?P<title>[^\r\n]{3,120})?
-    """),
-    re.compile(r"""(?ix)
-        \bSubject\s*:\s*RFI\s*(?:No\.?|\#\:|\#)?\s*(?P<num>\d{1,6})
-        \s*(?:[:\-]\s*)?
-        (?P<title>[^\r\n]{3,120})?
-    """),
-    re.compile(r"""(?ix)
-        \bRE\s*:\s*RFI\s*(?:No\.?|\#\:|\#)?\s*(?P<num>\d{1,6})
-        \s*(?:[:\-]\s*)?
-        (?P<title>[^\r\n]{3,120})?
-    """),
-]
+# Also covers "Subject: RFI ..." / "RE: RFI ...": \bRFI still holds after
+# those prefixes and the tail is the same, so no separate patterns are needed.
+RFI_HDR_RX = re.compile(r"""(?ix)
+    \bRFI\s*(?:No\.?|\#\:|\#)?\s*(?P<num>\d{1,6})
+    \s*(?:[:\-]\s*)?
+    (?P<title>[^\r\n]{3,120})?
+""")
 
 DESC_LINE_RX = re.compile(
     r"""(?ix)
@@ -112,38 +141,68 @@ DESC_LINE_RX = re.compile(
     """, re.MULTILINE,
 )
 AREA_IN_DESC_RX = re.compile(r"\barea\s+[A-Z]\b", re.IGNORECASE)
+HDR_LINE_RX = re.compile(r"^(subject|date|project|location)\b", re.IGNORECASE)
+
+MAX_DESC_LINES = 120
+# Same boundaries as str.splitlines() (pdfminer emits \x0c between pages)
+LINE_RX = re.compile(r"[^\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]+")
 
 def _extract_description(text: str) -> str:
     if not text:
         return ""
-    head = _normalize_text(text[:10000])
-    lines = [ln.strip() for ln in head.splitlines() if ln.strip()]
+    head, head_lower = _normalize_text(text[:10000])
+    # Every pattern needs a literal "RFI": without one, skip both scans below.
+    # IGNORECASE also lets a dotless "ı" stand in for "i", which lower() keeps
+    # as is, so the literal probes below only run when the head has none.
+    exact = "ı" not in head_lower
+    if exact and "rfi" not in head_lower:
+        return ""
 
-    # Try line-by-line first (captures split headers)
-    for i, ln in enumerate(lines[:120]):
-        if "rfi" not in ln.lower():
+    # Try line-by-line first (captures split headers). One lazy pass over the
+    # non-empty lines: a header without a title borrows the next line, so the
+    # scan reads at most MAX_DESC_LINES + 1 of them.
+    search = RFI_HDR_RX.search  # bound once; the loop can run 120 times per PDF
+    # lower() normally keeps offsets, so each line's "rfi" probe can run on the
+    # already-lowered head in place instead of lowering the line again
+    aligned = exact and len(head_lower) == len(head)
+    pending = ""  # number of a title-less header waiting for the next line
+    seen = 0
+    for lm in LINE_RX.finditer(head):
+        ln = lm.group().strip()
+        if not ln:
             continue
-        for rx in _PATTERNS:
-            m = rx.search(ln)
-            if not m:
+        if pending:
+            title = "" if HDR_LINE_RX.match(ln) else ln.strip(" :-")
+            return f"RFI #{pending}: {title}" if title else f"RFI #{pending}"
+        if seen == MAX_DESC_LINES:
+            break
+        seen += 1
+        if aligned:
+            if head_lower.find("rfi", lm.start(), lm.end()) < 0:
                 continue
-            num = (m.group("num") or "").strip()
-            title = (m.group("title") or "").strip(" :-")
-            if not title and i + 1 < len(lines):
-                nxt = lines[i + 1]
-                if not re.match(r"(?i)^(subject|date|project|location)\b", nxt):
-                    title = nxt.strip(" :-")
-            if num:
-                return f"RFI #{num}: {title}" if title else f"RFI #{num}"
-
-    # Fallback: whole-chunk search
-    for rx in _PATTERNS:
-        m = rx.search(head)
-        if m:
-            num = (m.group("num") or "").strip()
-            title = (m.group("title") or "").strip(" :-")
-            if num:
-                return f"RFI #{num}: {title}" if title else f"RFI #{num}"
+        elif exact and "rfi" not in ln.lower():
+            continue
+        m = search(ln)
+        if not m:
+            continue
+        num = (m.group("num") or "").strip()
+        title = (m.group("title") or "").strip(" :-")
+        if num:
+            if title:
+                return f"RFI #{num}: {title}"
+            pending = num
+    if pending:
+        return f"RFI #{pending}"
+
+    # Fallback: whole-chunk search, starting at the first "rfi" (nothing before
+    # it can match). Offsets only line up if lower() kept the length.
+    start = head_lower.find("rfi") if aligned else 0
+    m = RFI_HDR_RX.search(head, start)
+    if m:
+        num = (m.group("num") or "").strip()
+        title = (m.group("title") or "").strip(" :-")
+        if num:
+            return f"RFI #{num}: {title}" if title else f"RFI #{num}"
 
     return ""  # caller sets default
 
@@ -151,7 +210,8 @@ def _extract_description(text: str) -> str:
 def _maybe_append_area(desc: str, area_raw: str) -> str:
     if not desc or not area_raw:
         return desc or ""
-    if area_raw.lower() in desc.lower() or AREA_IN_DESC_RX.search(desc):
+    desc_lower = desc.lower()
+    if area_raw.lower() in desc_lower or ("area" in desc_lower and AREA_IN_DESC_RX.search(desc)):
         return desc
     return f"{desc} - {area_raw}"
 
@@ -169,8 +229,118 @@ def _top_signals(matched: List[str], k: int = 3) -> str:
     return ", ".join(uniq)
 
 
-def process_pdf(pdf_path: str, rfi_no_hint: str, ocr_if_needed: bool, ocr_max_pages: int) -> Dict[str, Any]:
-    p = Path(pdf_path)
+def _ocr_exhausted(meta: Dict[str, Any], ocr_max_pages: int, retry_pages: int) -> bool:
+    """
+    True when the first attempt already OCR'd everything a retry would:
+    either it reached the retry page budget, or it stopped short of its own
+    budget because the document has no more pages. Also True when OCR itself
+    failed (Poppler/Tesseract missing), since a retry would fail the same way.
+    """
+    if (meta.get("ocr") or {}).get("error"):
+        return True
+    if not meta.get("ocr_used"):
+        return False
+    done = meta.get("ocr_pages", 0) or 0
+    return done >= retry_pages or done < (ocr_max_pages or 10)
+
+# Per-worker memo of text-derived results, keyed by a digest of the text so
+# duplicate PDFs (same content in several folders) handled by the same worker
+# skip the regex work without the cache holding on to the texts. It is read
+# once per process_pdf, after the retry has settled on one text, so it never
+# dedupes attempts within a PDF.
+TEXT_CACHE_SIZE = 256
+_text_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+# Optional on-disk layer under that memo (one JSON file per distinct text), so
+# reruns and incremental scans reuse results across processes and runs. Off
+# unless RFI_CACHE=1; it is never pruned, so clear RFI_CACHE_DIR by hand.
+# Entries are keyed on a fingerprint of everything that shapes the results
+# (rule/pattern sources and MAX_SCAN_CHARS), so editing either starts a fresh
+# keyspace. CACHE_VERSION covers the JSON layout only.
+CACHE_VERSION = 1
+CACHE_DIR = Path(os.getenv("RFI_CACHE_DIR") or "~/.cache/rfi_scanner").expanduser()
+CACHE_ENABLED = os.getenv("RFI_CACHE", "0").strip().lower() not in {"0", "false", "no", "off", ""}
+CACHE_SOURCES = ("workers.py", "nlp/rules.py", "nlp/classifier.py", "Fields/field_extractor.py")
+
+def _results_fingerprint() -> bytes:
+    h = hashlib.sha256(f"v{CACHE_VERSION}\0{MAX_SCAN_CHARS}\0".encode())
+    root = Path(__file__).resolve().parent
+    for rel in CACHE_SOURCES:
+        try:
+            h.update((root / rel).read_bytes())
+        except OSError:
+            h.update(f"missing:{rel}".encode())
+        h.update(b"\0")
+    return h.digest()
+
+_CACHE_SALT = _results_fingerprint() if CACHE_ENABLED else b""
+
+def _text_key(text: str) -> str:
+    h = hashlib.sha256(_CACHE_SALT)
+    h.update(text.encode("utf-8", "surrogatepass"))
+    return h.hexdigest()
+
+def _cache_file(key: str) -> Path:
+    return CACHE_DIR / key[:2] / f"{key}.json"
+
+def _load_results(key: str) -> Dict[str, Any]:
+    if not CACHE_ENABLED:
+        return {}
+    try:
+        with open(_cache_file(key), encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+def _save_results(key: str, results: Dict[str, Any]) -> None:
+    # best effort: a failed write only costs a recompute next run
+    if not CACHE_ENABLED:
+        return
+    path = _cache_file(key)
+    tmp = path.with_name(f"{path.name}.tmp.{os.getpid()}")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False)
+        os.replace(tmp, path)
+    except (OSError, TypeError, ValueError):
+        try: tmp.unlink(missing_ok=True)
+        except OSError: pass
+
+def _text_results(text: str) -> Tuple[str, Dict[str, Any]]:
+    key = _text_key(text)
+    entry = _text_cache.get(key)
+    if entry is None:
+        entry = _text_cache[key] = _load_results(key)
+        if len(_text_cache) > TEXT_CACHE_SIZE:
+            _text_cache.popitem(last=False)
+    else:
+        _text_cache.move_to_end(key)
+    return key, entry
+
+def _memo(results: Dict[str, Any], name: str, fn: Callable[[str], Any], text: str) -> Any:
+    # exceptions propagate uncached, so the caller's warning handling still applies
+    if name not in results:
+        results[name] = fn(text)
+    return results[name]
+
+WARMUP_TEXT = "RFI #1: Warmup header\nSubject: RFI 1\nArea G Phase 2 see 1/A-501 and SK-1\nDetail 3"
+
+def warm_up() -> None:
+    """
+    Run every text-derived step once on a tiny sample so a fresh worker pays
+    its first-call costs (classifier setup, regex/method lookups) up front.
+    Bypasses the memo so the sample never occupies a cache slot.
+    """
+    classify(WARMUP_TEXT)
+    detail_ref_list(WARMUP_TEXT)
+    _detect_area_phase_raw(WARMUP_TEXT)
+    _extract_description(WARMUP_TEXT)
+
+def process_pdf(pdf_path: str | Path, rfi_no_hint: str, ocr_if_needed: bool, ocr_max_pages: int) -> Dict[str, Any]:
+    p = pdf_path if isinstance(pdf_path, Path) else Path(pdf_path)
+    pdf_str = str(p)  # every output column below reuses this one string
     t0 = time.perf_counter()
     warnings: List[str] = []
 
@@ -179,11 +349,16 @@ def process_pdf(pdf_path: str, rfi_no_hint: str, ocr_if_needed: bool, ocr_max_pa
         text, meta = extract_text_with_meta(p, ocr_if_needed=ocr_if_needed, ocr_max_pages=ocr_max_pages)
         attempts = 1
         forced = False
-        if len((text or "").strip()) < MIN_OK_LEN and ocr_if_needed:
+        retry_pages = max(ocr_max_pages, RETRY_OCR_PAGES)
+        if meta.get("page_count"):
+            # never budget OCR for pages the document doesn't have
+            retry_pages = min(retry_pages, meta["page_count"])
+        if (len((text or "").strip()) < MIN_OK_LEN and ocr_if_needed
+                and not _ocr_exhausted(meta, ocr_max_pages, retry_pages)):
             forced = True
             attempts = 2
             try:
-                text2, meta2 = extract_text_with_meta(p, ocr_if_needed=True, ocr_max_pages=max(ocr_max_pages, 20))
+                text2, meta2 = extract_text_with_meta(p, ocr_if_needed=True, ocr_max_pages=retry_pages)
                 if len((text2 or "").strip()) > len((text or "").strip()):
                     text, meta = text2, meta2
             except Exception as e2:
@@ -191,16 +366,19 @@ def process_pdf(pdf_path: str, rfi_no_hint: str, ocr_if_needed: bool, ocr_max_pa
 
         # RFI number from folder/stem
         try:
-            rfi_no = rfi_number_from_folder(p.parent.name) or rfi_no_hint or rfi_number_from_folder(p.stem) or "RFI-UNK"
+            rfi_no = _rfi_no_from_folder(p.parent.name) or rfi_no_hint or _rfi_no_from_folder(p.stem) or "RFI-UNK"
         except Exception as e:
             rfi_no = rfi_no_hint or "RFI-UNK"
             warnings.append(f"rfi_number:{type(e).__name__}")
 
-        pdf_title = str(p)
+        pdf_title = pdf_str
+        text_key, results = _text_results(text or "")
+        known = len(results)
+        scan_text = (text or "")[:MAX_SCAN_CHARS]  # no copy when already shorter
 
-        # Classification (deterministic)
+        # Classification (deterministic); copied because out-of-scope edits it below
         try:
-            cls = classify(text or "")
+            cls = dict(_memo(results, "classify", classify, scan_text))
         except Exception as e:
             warnings.append(f"classify:{type(e).__name__}")
             cls = {
@@ -212,13 +390,13 @@ def process_pdf(pdf_path: str, rfi_no_hint: str, ocr_if_needed: bool, ocr_max_pa
 
         # Detail references
         try:
-            drefs = _limit_csv_list(detail_refs(text or "") or "", 6)
+            drefs = _limit_list(_memo(results, "detail_refs", detail_ref_list, scan_text), 6)
         except Exception as e:
             drefs = ""; warnings.append(f"detail_refs:{type(e).__name__}")
 
         # Area/Phase + out-of-scope detection
         try:
-            area_raw, out_of_scope = _detect_area_phase_raw(text or "")
+            area_raw, out_of_scope = _memo(results, "area", _detect_area_phase_raw, text or "")
         except Exception as e:
             area_raw, out_of_scope = "", False
             warnings.append(f"area_detect:{type(e).__name__}")
@@ -229,7 +407,7 @@ def process_pdf(pdf_path: str, rfi_no_hint: str, ocr_if_needed: bool, ocr_max_pa
 
         # Description (default "Unknown" if missing), then append area if helpful
         try:
-            description = _extract_description(text or "")
+            description = _memo(results, "description", _extract_description, text or "")
             if not description:
                 description = "Unknown"
             description = _maybe_append_area(description, area_raw)
@@ -237,9 +415,12 @@ def process_pdf(pdf_path: str, rfi_no_hint: str, ocr_if_needed: bool, ocr_max_pa
             description = "Unknown"
             warnings.append(f"description:{type(e).__name__}")
 
+        if len(results) > known:
+            _save_results(text_key, results)
+
         # Top 3 matched keywords for quick reviewer context
         try:
-            top_signals = _top_signals(list(cls.get("MatchedKeywords", [])), 3)
+            top_signals = _top_signals(cls.get("MatchedKeywords") or [], 3)
         except Exception as e:
             top_signals = ""; warnings.append(f"top_signals:{type(e).__name__}")
 
@@ -262,13 +443,13 @@ def process_pdf(pdf_path: str, rfi_no_hint: str, ocr_if_needed: bool, ocr_max_pa
             "AreaCategory": area_category,
             "DetailRefs": drefs,
             "TopSignals": top_signals,
-            "LocalPath": str(p),
+            "LocalPath": pdf_str,
             "Status": "ok" if not warnings else "ok_warn",
             "Error": "; ".join(warnings),
         }
 
         meta_out = {
-            "pdf": str(p), "rfi_no": rfi_no,
+            "pdf": pdf_str, "rfi_no": rfi_no,
             "method": meta.get("method", "unknown"),
             "text_len": meta.get("text_len", 0),
             "ocr_used": bool(meta.get("ocr_used", False)),
@@ -283,21 +464,21 @@ def process_pdf(pdf_path: str, rfi_no_hint: str, ocr_if_needed: bool, ocr_max_pa
 
     except Exception as e:
         meta_out = {
-            "pdf": str(p), "rfi_no": rfi_no_hint, "method": "error", "text_len": 0,
+            "pdf": pdf_str, "rfi_no": rfi_no_hint, "method": "error", "text_len": 0,
             "ocr_used": False, "ocr_pages": 0, "attempts": 1, "forced_second_attempt": False,
             "elapsed_ms": round((time.perf_counter()-t0)*1000, 1),
             "status": "error", "error": f"{type(e).__name__}: {e}",
         }
         row = {
-            "RfiNumber": rfi_no_hint or rfi_number_from_folder(p.parent.name) or "RFI-UNK",
-            "PdfTitle": str(p),
+            "RfiNumber": rfi_no_hint or _rfi_no_from_folder(p.parent.name) or "RFI-UNK",
+            "PdfTitle": pdf_str,
             "Description": "Unknown",
             "RequiresDrawingRevision": "No",
             "DecisionBasis": "InsufficientSignal",
             "AreaCategory": "General",
             "DetailRefs": "",
             "TopSignals": "",
-            "LocalPath": str(p),
+            "LocalPath": pdf_str,
             "Status": "error", "Error": f"{type(e).__name__}: {e}",
         }
         return {"ok": False, "row": row, "meta": meta_out}